@@ -1,19 +1,80 @@
 import gradio as gr
-import pandas as pd
+import numpy as np
+from dataclasses import astuple, dataclass
 from datetime import datetime
+from operator import itemgetter
+import atexit
+import csv
 import os
 
 # Initialize storage for scores with proper column names
 COLUMNS = ['timestamp', 'judge_name', 'team_name', 'go_live', 'usefulness', 'taste', 'problem_statement']
+SCORE_COLUMNS = ['go_live', 'usefulness', 'taste', 'problem_statement']
 
-if not os.path.exists('scores.csv'):
-    # Create empty DataFrame with proper columns
-    df = pd.DataFrame(columns=COLUMNS)
-    # Write to CSV with columns
-    df.to_csv('scores.csv', index=False, mode='w')
-elif os.path.getsize('scores.csv') == 0:
-    # If file exists but is empty, write headers
-    pd.DataFrame(columns=COLUMNS).to_csv('scores.csv', index=False, mode='w')
+# Criterion weights pre-multiplied by the 100-point scale factor
+SCORE_WEIGHTS = np.array([6.0, 6.0, 4.0, 4.0], dtype=np.float32)
+
+# All 21 possible score bars (0-20 filled cells), precomputed once
+BARS = tuple('█' * i + '░' * (20 - i) for i in range(21))
+
+# One submitted score; field order matches COLUMNS so astuple() gives a
+# ready-to-write CSV row
+@dataclass(slots=True)
+class Score:
+    timestamp: str
+    judge_name: str
+    team_name: str
+    go_live: int
+    usefulness: int
+    taste: int
+    problem_statement: int
+
+# Write the header row if the file is missing or empty; plain stdlib so
+# no pandas machinery runs before the UI renders
+if not os.path.exists('scores.csv') or os.path.getsize('scores.csv') == 0:
+    with open('scores.csv', 'w', newline='') as _f:
+        _f.write(','.join(COLUMNS) + '\n')
+
+# In-process source of truth: one record per (judge, team), with judges matched
+# case-insensitively. Loaded once at startup; submissions only append to the
+# CSV, so superseded rows linger on disk until the next compaction.
+SCORES = {}
+_STALE_ROWS = 0  # superseded rows still sitting in scores.csv
+_STALE_LIMIT = 64  # compact the file once this many pile up
+
+with open('scores.csv', newline='') as _f:
+    for _row in csv.DictReader(_f):
+        _score = Score(_row['timestamp'], _row['judge_name'], _row['team_name'],
+                       *(int(float(_row[c])) for c in SCORE_COLUMNS))
+        _key = (_score.judge_name.strip().lower(), _score.team_name)
+        if _key in SCORES:
+            _STALE_ROWS += 1
+        SCORES[_key] = _score
+
+# Memoized report render, invalidated only when scores.csv changes on disk
+_REPORT_CACHE = {'mtime': None, 'report': None}
+
+# Long-lived append handle so each submission is a single buffered write;
+# submit_score flushes after each row, so no fsync and no reopen per click
+_SCORES_FILE = open('scores.csv', 'a', buffering=1 << 20, newline='')
+_SCORES_WRITER = csv.writer(_SCORES_FILE)
+
+def _close_scores_file():
+    _SCORES_FILE.close()
+
+atexit.register(_close_scores_file)
+
+def _rewrite_scores():
+    # Compact the CSV back down to one row per (judge, team)
+    global _SCORES_FILE, _SCORES_WRITER, _STALE_ROWS
+    _SCORES_FILE.close()
+    with open('scores.csv', 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        writer.writerows(astuple(record) for record in SCORES.values())
+    _SCORES_FILE = open('scores.csv', 'a', buffering=1 << 20, newline='')
+    _SCORES_WRITER = csv.writer(_SCORES_FILE)
+    _STALE_ROWS = 0
 
 def calculate_final_score(go_live, usefulness, taste, problem_statement):
     # Calculate weighted score
@@ -26,135 +87,143 @@ def calculate_final_score(go_live, usefulness, taste, problem_statement):
     return round(final_score, 2)
 
 def submit_score(judge_name, team_name, go_live, usefulness, taste, problem_statement):
-    if not judge_name.strip():
+    global _STALE_ROWS
+    judge = judge_name.strip()
+    if not judge:
         return "Please enter your name!", judge_name
     if not team_name:
         return "Please select a team!", judge_name
-    
+    if team_name not in TEAM_NAMES_SET:
+        return "Unknown team!", judge_name
+
     try:
-        # Read existing scores, if file is empty, create new DataFrame
-        try:
-            scores_df = pd.read_csv('scores.csv')
-        except pd.errors.EmptyDataError:
-            scores_df = pd.DataFrame(columns=COLUMNS)
-        
         # Validate score ranges
         scores = [go_live, usefulness, taste, problem_statement]
         if any(score < 0 or score > 5 for score in scores):
             return "All scores must be between 0 and 5!", judge_name
-        
-        # Check for duplicate scoring
-        if len(scores_df) > 0:
-            duplicate = scores_df[
-                (scores_df['judge_name'].str.lower() == judge_name.strip().lower()) & 
-                (scores_df['team_name'] == team_name)
-            ]
-            if not duplicate.empty:
-                # Remove previous score if exists
-                scores_df = scores_df[
-                    ~((scores_df['judge_name'].str.lower() == judge_name.strip().lower()) & 
-                      (scores_df['team_name'] == team_name))
-                ]
-        
+
         # Add new score
-        new_score = {
-            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            'judge_name': judge_name.strip(),
-            'team_name': team_name.strip(),
-            'go_live': go_live,
-            'usefulness': usefulness,
-            'taste': taste,
-            'problem_statement': problem_statement
-        }
-        
-        scores_df = pd.concat([scores_df, pd.DataFrame([new_score])], ignore_index=True)
-        scores_df.to_csv('scores.csv', index=False)
-        
+        new_score = Score(
+            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            judge_name=judge,
+            team_name=team_name.strip(),
+            go_live=int(go_live),
+            usefulness=int(usefulness),
+            taste=int(taste),
+            problem_statement=int(problem_statement)
+        )
+
+        # Replace any previous score from this judge for this team
+        key = (judge.lower(), team_name)
+        if SCORES.pop(key, None) is not None:
+            _STALE_ROWS += 1
+        SCORES[key] = new_score
+
+        # Append the one new row; no re-read, no concat, no full rewrite
+        _SCORES_WRITER.writerow(astuple(new_score))
+        _SCORES_FILE.flush()
+
+        if _STALE_ROWS >= _STALE_LIMIT:
+            _rewrite_scores()
+
         return f"✅ Score submitted successfully for team {team_name}!", judge_name
-    
+
     except Exception as e:
         return f"Error submitting score: {str(e)}", judge_name
 
 def generate_report():
     try:
-        scores_df = pd.read_csv('scores.csv')
-        if len(scores_df) == 0:
-            return "No scores submitted yet!"
-        
-        # Calculate average scores and number of judges per team
-        team_stats = scores_df.groupby('team_name').agg({
-            'judge_name': 'count',  # Count number of judges
-            'go_live': 'mean',
-            'usefulness': 'mean',
-            'taste': 'mean',
-            'problem_statement': 'mean'
-        }).round(2)
-        
-        team_stats.rename(columns={'judge_name': 'num_judges'}, inplace=True)
-        
-        # Calculate final weighted scores
-        team_stats['final_score'] = team_stats.apply(
-            lambda x: calculate_final_score(x['go_live'], x['usefulness'], x['taste'], x['problem_statement']),
-            axis=1
-        )
-        
-        # Sort by final score
-        team_stats = team_stats.sort_values('final_score', ascending=False)
-        
-        # Format report with better visualization
-        report = "🏆 HACKATHON FINAL RANKINGS 🏆\n"
-        report += "=" * 40 + "\n\n"
-        
-        for idx, (team, stats) in enumerate(team_stats.iterrows(), 1):
+        # Serve the memoized render unless a submission landed since
+        mtime = os.stat('scores.csv').st_mtime_ns
+        if mtime == _REPORT_CACHE['mtime']:
+            return _REPORT_CACHE['report']
+
+        if not SCORES:
+            _REPORT_CACHE.update(mtime=mtime, report="No scores submitted yet!")
+            return _REPORT_CACHE['report']
+
+        # The keyed store is already de-duplicated; aggregate per team with
+        # bincount over small integer team codes instead of a groupby
+        records = [s for s in SCORES.values() if s.team_name in TEAM_NAMES_SET]
+        codes = np.fromiter((TEAM_CODES[s.team_name] for s in records),
+                            dtype=np.intp, count=len(records))
+        counts = np.bincount(codes, minlength=len(TEAM_NAMES))
+        scored = counts > 0
+
+        means = {}
+        for col in SCORE_COLUMNS:
+            values = np.fromiter((getattr(s, col) for s in records),
+                                 dtype=np.float32, count=len(records))
+            sums = np.bincount(codes, weights=values, minlength=len(TEAM_NAMES))
+            means[col] = np.round(sums / np.maximum(counts, 1), 2)
+
+        # Final weighted scores for every team in a single dot product
+        final_scores = np.round(
+            np.column_stack([means[c] for c in SCORE_COLUMNS]) @ SCORE_WEIGHTS, 2)
+
+        # Rank the scored teams in plain Python, one row tuple per team
+        ranked = sorted(
+            ((TEAM_NAMES[i], int(counts[i]),
+              means['go_live'][i], means['usefulness'][i],
+              means['taste'][i], means['problem_statement'][i],
+              final_scores[i])
+             for i in np.flatnonzero(scored)),
+            key=itemgetter(6), reverse=True)
+
+        # Format report with better visualization; collect the pieces and
+        # join once instead of growing a string with repeated +=
+        parts = ["🏆 HACKATHON FINAL RANKINGS 🏆\n"]
+        parts.append("=" * 40 + "\n\n")
+
+        for idx, (team, num_judges, go_live, usefulness, taste, problem_statement, final_score) in enumerate(ranked, 1):
             medal = "🥇" if idx == 1 else "🥈" if idx == 2 else "🥉" if idx == 3 else "  "
-            
-            report += f"{medal} Rank #{idx}: {team}\n"
-            report += "─" * 40 + "\n"
-            report += f"📊 FINAL SCORE: {stats['final_score']:.1f}/100"
-            report += f" (Scored by {int(stats['num_judges'])} judge{'s' if stats['num_judges'] > 1 else ''})\n\n"
-            
+
+            parts.append(f"{medal} Rank #{idx}: {team}\n")
+            parts.append("─" * 40 + "\n")
+            parts.append(f"📊 FINAL SCORE: {final_score:.1f}/100")
+            parts.append(f" (Scored by {num_judges} judge{'s' if num_judges > 1 else ''})\n\n")
+
             # Detailed scores with visual bars
-            report += "Detailed Scores:\n"
-            
+            parts.append("Detailed Scores:\n")
+
             # Go Live (30%)
-            bar_length = int(stats['go_live'] * 4)
-            report += f"Go Live       (30%): {stats['go_live']}/5 {'█' * bar_length}{'░' * (20-bar_length)}\n"
-            
+            parts.append(f"Go Live       (30%): {go_live}/5 {BARS[min(int(go_live * 4), 20)]}\n")
+
             # Usefulness (30%)
-            bar_length = int(stats['usefulness'] * 4)
-            report += f"Usefulness   (30%): {stats['usefulness']}/5 {'█' * bar_length}{'░' * (20-bar_length)}\n"
-            
+            parts.append(f"Usefulness   (30%): {usefulness}/5 {BARS[min(int(usefulness * 4), 20)]}\n")
+
             # Taste (20%)
-            bar_length = int(stats['taste'] * 4)
-            report += f"Taste        (20%): {stats['taste']}/5 {'█' * bar_length}{'░' * (20-bar_length)}\n"
-            
+            parts.append(f"Taste        (20%): {taste}/5 {BARS[min(int(taste * 4), 20)]}\n")
+
             # Problem Statement (20%)
-            bar_length = int(stats['problem_statement'] * 4)
-            report += f"Problem Stmt (20%): {stats['problem_statement']}/5 {'█' * bar_length}{'░' * (20-bar_length)}\n"
-            
-            report += "\n" + "=" * 40 + "\n\n"
+            parts.append(f"Problem Stmt (20%): {problem_statement}/5 {BARS[min(int(problem_statement * 4), 20)]}\n")
+
+            parts.append("\n" + "=" * 40 + "\n\n")
         
         # Enhanced summary footer
-        report += f"Total Teams Evaluated: {len(team_stats)}\n"
-        report += f"Total Scores Submitted: {len(scores_df)}\n"
-        report += f"Number of Judges: {scores_df['judge_name'].nunique()}\n"
-        report += f"Average Score: {team_stats['final_score'].mean():.1f}/100\n"
-        report += f"Highest Score: {team_stats['final_score'].max():.1f}/100\n"
-        
+        parts.append(f"Total Teams Evaluated: {len(ranked)}\n")
+        parts.append(f"Total Scores Submitted: {len(records)}\n")
+        parts.append(f"Number of Judges: {len({s.judge_name for s in records})}\n")
+        parts.append(f"Average Score: {final_scores[scored].mean():.1f}/100\n")
+        parts.append(f"Highest Score: {final_scores[scored].max():.1f}/100\n")
+
         # Add teams not yet scored
-        unscored_teams = set(TEAM_NAMES) - set(team_stats.index)
+        unscored_teams = {team for team, seen in zip(TEAM_NAMES, scored) if not seen}
         if unscored_teams:
-            report += "\nTeams Not Yet Scored:\n"
-            for team in sorted(unscored_teams):
-                report += f"• {team}\n"
-        
+            parts.append("\nTeams Not Yet Scored:\n")
+            for team in TEAM_NAMES_SORTED:
+                if team in unscored_teams:
+                    parts.append(f"• {team}\n")
+
+        report = "".join(parts)
+        _REPORT_CACHE.update(mtime=mtime, report=report)
         return report
     
     except Exception as e:
         return f"Error generating report: {str(e)}"
 
-# Define team names list
-TEAM_NAMES = [
+# Define team names, in UI order
+TEAM_NAMES = (
     "tehlaninayan7",
     "kya@karu.mai",
     "Sugarplum",
@@ -170,7 +239,14 @@ TEAM_NAMES = [
     "Team 1",
     "fiction AI",
     "SOLOYOLO"
-]
+)
+TEAM_NAMES_SORTED = tuple(sorted(TEAM_NAMES))
+
+# Frozen view for O(1) membership checks; the tuple above keeps UI order
+TEAM_NAMES_SET = frozenset(TEAM_NAMES)
+
+# Integer code per team for the bincount aggregation in generate_report
+TEAM_CODES = {team: i for i, team in enumerate(TEAM_NAMES)}
 
 # Create Gradio interface
 with gr.Blocks(title="Hackathon Judge", theme=gr.themes.Soft()) as app: